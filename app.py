@@ -8,15 +8,18 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
+from utils.bootstrap import load_static_text, page_timer, render_timings  # noqa: E402
+
+render_done = page_timer("Home")
+
 # Basic page config
 st.set_page_config(page_title="Market Predictor Pro", layout="wide")
 
-# Load custom CSS if present
+# Load custom CSS if present (read from disk once per process)
 def load_css():
-    css_path = PROJECT_ROOT / "styles" / "style.css"
-    if css_path.exists():
-        with css_path.open("r", encoding="utf-8") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    css = load_static_text("styles/style.css")
+    if css is not None:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
     else:
         st.sidebar.info("Optional: styles/style.css not found; using default theme.")
 
@@ -43,3 +46,6 @@ if pages_dir.exists():
                 st.write(f"- {p.name}")
 else:
     st.warning("No 'pages/' directory found. Create one for additional pages.")
+
+render_done()
+render_timings()
@@ -0,0 +1,167 @@
+# benchmarks/bench_startup.py
+
+# Cold-start benchmark for the app's utils modules.
+# - Current: runs `python -X importtime -c "import <module>"` in a fresh
+#   interpreter per module and reports the cumulative import time, plus
+#   whether streamlit, plotly or yfinance were pulled in at import.
+# - Baseline: the pre-lazy-loading utils/charting.py and utils/data_fetcher.py
+#   are extracted from git (BASELINE_COMMIT) into a temporary package and
+#   profiled the same way, both standalone and with streamlit already loaded
+#   (as inside the app, where every page imports it first).
+# - Times reading styles/style.css from disk on every rerun versus the
+#   process-level cached load_static_text.
+#
+# Usage (from the project root):
+#   python benchmarks/bench_startup.py
+
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+MODULES = [
+    "utils.bootstrap",
+    "utils.charting",
+    "utils.data_fetcher",
+    "utils.symbol_universe",
+    "utils.score_engine",
+    "utils.alert_engine",
+]
+HEAVY = ("streamlit", "plotly", "yfinance")
+
+# Commit before lazy loading, and the modules whose imports it changed
+BASELINE_COMMIT = "4d941d8"
+BASELINE_MODULES = ["charting", "data_fetcher"]
+RERUNS = 1000
+
+
+def installed(module):
+    return importlib.util.find_spec(module.split(".")[0]) is not None
+
+
+def import_profile(modules, preload=(), pythonpath=None):
+    """
+    Import modules in a fresh interpreter under -X importtime.
+
+    preload is imported first and not counted, so shared dependencies it
+    pulls in are excluded from the measured modules.
+
+    Returns:
+        cumulative_us (int): summed cumulative import time, or None if the import failed
+        heavy (list): heavy top-level packages imported along the way
+    """
+    # importtime also lists failed attempts (e.g. bootstrap probing for
+    # streamlit), so heavy packages are read back from sys.modules instead.
+    code = "\n".join(
+        [f"import {m}" for m in (*preload, *modules)]
+        + ["import sys", f"print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"]
+    )
+    env = dict(os.environ)
+    if pythonpath:
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [pythonpath, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        return None, []
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        # Nested imports are indented; only count the requested top-level ones
+        if name in modules and parts[2] == f" {name}":
+            cumulative_us += int(parts[1])
+    return cumulative_us, proc.stdout.split()
+
+
+def extract_baseline(dest):
+    """Write the BASELINE_COMMIT versions of BASELINE_MODULES to dest/baseline_utils."""
+    package = Path(dest) / "baseline_utils"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    for name in BASELINE_MODULES:
+        source = subprocess.run(
+            ["git", "show", f"{BASELINE_COMMIT}:utils/{name}.py"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        (package / f"{name}.py").write_text(source, encoding="utf-8")
+
+
+def fmt_ms(us):
+    return f"{us / 1000:.1f}" if us is not None else "failed"
+
+
+def bench_css():
+    from utils.bootstrap import PROJECT_ROOT as root, load_static_text
+
+    css_path = root / "styles" / "style.css"
+
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        with css_path.open("r", encoding="utf-8") as f:
+            f.read()
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        load_static_text("styles/style.css")
+    cached = time.perf_counter() - start
+    return uncached, cached
+
+
+def compare(preload, tmp):
+    for name in BASELINE_MODULES:
+        before_us, before_heavy = import_profile([f"baseline_utils.{name}"], preload, tmp)
+        after_us, after_heavy = import_profile([f"utils.{name}"], preload)
+        before = (
+            f"{fmt_ms(before_us)} ms ({', '.join(before_heavy) or '-'})"
+            if before_us is not None else "import failed"
+        )
+        after = f"{fmt_ms(after_us)} ms ({', '.join(after_heavy) or '-'})"
+        print(f"  utils.{name:<16} before {before:<32} now {after}")
+
+
+def main():
+    missing = [m for m in HEAVY if not installed(m)]
+    if missing:
+        print(f"Not installed: {', '.join(missing)} (imports of them fail or use fallbacks)")
+        print()
+
+    print(f"{'module':<24}{'import (ms)':>12}  heavy imports")
+    for module in MODULES:
+        cumulative_us, heavy = import_profile([module])
+        print(f"{module:<24}{fmt_ms(cumulative_us):>12}  {', '.join(heavy) or '-'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            extract_baseline(tmp)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"\nBaseline unavailable ({BASELINE_COMMIT} not readable from git): {e}")
+        else:
+            print(f"\nBaseline {BASELINE_COMMIT} vs now, standalone (fresh interpreter):")
+            compare((), tmp)
+            if installed("streamlit"):
+                print("\nBaseline vs now, streamlit already imported (as in the app):")
+                compare(("streamlit",), tmp)
+            else:
+                print("\nstreamlit not installed: in-app comparison skipped")
+
+    uncached, cached = bench_css()
+    print()
+    print(f"style.css x{RERUNS}: disk read {uncached * 1000:.1f} ms, cached {cached * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
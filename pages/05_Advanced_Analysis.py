@@ -2,12 +2,13 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 # Local utils
 from utils.data_fetcher import fetch_stock_data_with_fallback
 from utils.technicals import calculate_rsi, calculate_macd, calculate_smoothed_ma
+from utils.bootstrap import page_timer, plotly_modules
+
+render_done = page_timer("Advanced Analysis")
 
 # Always render a title so page is never blank
 st.title("🚀 Market Predictor Pro")
@@ -144,6 +145,7 @@ with tab2:
         df_ta = fetch_stock_data_with_fallback(symbol, period=period)
         if not df_ta.empty:
             df_ta = _safe_indicators(df_ta).dropna()
+            go, make_subplots = plotly_modules()
             fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3])
             fig.add_trace(go.Candlestick(
                 x=df_ta.index, open=df_ta["Open"], high=df_ta["High"],
@@ -163,3 +165,5 @@ with tab2:
 with tab3:
     st.markdown("### 🎲 Monte Carlo")
     st.info("Monte Carlo simulation coming next. Use Predictions and Technical Analysis tabs in the meantime.")
+
+render_done()
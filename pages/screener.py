@@ -5,6 +5,9 @@ from utils.symbol_universe import load_all_symbols
 from utils.data_fetcher import fetch_stock_data_with_fallback
 from utils.score_engine import score_stock
 from utils.charting import create_tv_chart
+from utils.bootstrap import page_timer
+
+render_done = page_timer("Screener")
 
 # Always show a header so the page is never blank
 st.title("🔥 Mega Stock Screener")
@@ -54,3 +57,5 @@ if st.button("Run Screener", type="primary"):
                 st.error(f"{res['symbol']}: chart failed — {e}")
     else:
         st.info("No stocks matched the screening criteria. Try lowering the minimum score or adding more symbols.")
+
+render_done()
@@ -4,6 +4,9 @@ from utils.symbol_universe import load_all_symbols
 from utils.score_engine import score_stock
 from utils.data_fetcher import fetch_stock_data_with_fallback
 from utils.charting import create_tv_chart
+from utils.bootstrap import page_timer
+
+render_done = page_timer("Sector")
 
 # Always render a header so the page is never blank
 st.title("🏭 Sector Analysis")
@@ -57,3 +60,5 @@ if st.button("Run Sector Analysis", type="primary"):
                     st.error(f"{sym}: chart render failed — {e}")
         else:
             st.info(f"No stocks passed scoring for sector '{sector}' with min score {min_score}. Try lowering the threshold or expanding sectors.")
+
+render_done()
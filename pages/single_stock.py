@@ -3,6 +3,9 @@ import streamlit as st
 from utils.data_fetcher import fetch_stock_data_with_fallback
 from utils.score_engine import score_stock
 from utils.charting import create_tv_chart
+from utils.bootstrap import page_timer
+
+render_done = page_timer("Single Stock")
 
 # Always render a title so the page is never blank
 st.title("🔬 Single Stock Analysis")
@@ -44,3 +47,5 @@ if sym:
             st.write(df.tail(5))
 else:
     st.info("Enter a stock symbol to begin analysis.")
+
+render_done()
@@ -1,8 +1,17 @@
 import streamlit as st
 
 from utils.data_fetcher import fetch_stock_data_with_fallback
-from utils.score_engine import score_stock
+from utils.alert_engine import AlertEngine, RULE_KINDS, describe_rule
 from utils.charting import create_tv_chart
+from utils.bootstrap import page_timer
+
+render_done = page_timer("Watchlist")
+
+engine = AlertEngine()
+
+# Reruns within the TTL reuse the last download; the alert engine then only
+# processes bars it has not seen yet.
+fetch_cached = st.cache_data(ttl=300, show_spinner=False)(fetch_stock_data_with_fallback)
 
 # Always render a title so the page is never blank
 st.title("⭐ Watchlist")
@@ -28,6 +37,54 @@ if st.session_state["watchlist"]:
             if stock in st.session_state["watchlist"]:
                 st.session_state["watchlist"].remove(stock)
 
+# Alert rules
+with st.expander("🔔 Alert rules", expanded=False):
+    if st.session_state["watchlist"]:
+        with st.form("rule_form", clear_on_submit=True):
+            rule_sym = st.selectbox("Symbol", st.session_state["watchlist"])
+            kind = st.selectbox("Condition", list(RULE_KINDS), format_func=RULE_KINDS.get)
+            c1, c2 = st.columns(2)
+            with c1:
+                threshold = st.number_input("Score threshold", value=10, step=1)
+                rsi_low = st.number_input("RSI zone low", value=0.0, min_value=0.0, max_value=100.0)
+            with c2:
+                direction = st.selectbox("Direction", ["above / bullish", "below / bearish"])
+                rsi_high = st.number_input("RSI zone high", value=30.0, min_value=0.0, max_value=100.0)
+            if st.form_submit_button("Add Alert"):
+                up = direction.startswith("above")
+                params = {}
+                if kind == "score_cross":
+                    params = {"threshold": threshold, "direction": "above" if up else "below"}
+                elif kind == "rsi_zone":
+                    params = {"low": rsi_low, "high": rsi_high}
+                elif kind == "macd_cross":
+                    params = {"direction": "bullish" if up else "bearish"}
+
+                if kind == "rsi_zone" and rsi_low > rsi_high:
+                    st.error(f"RSI zone low ({rsi_low:g}) must not exceed high ({rsi_high:g}).")
+                else:
+                    try:
+                        engine.add_rule(rule_sym, kind, **params)
+                    except ValueError as e:
+                        st.error(f"{rule_sym}: could not save alert — {e}")
+
+    all_rules = engine.rules()
+    if not all_rules:
+        st.caption("No alert rules yet.")
+    for rule_sym, sym_rules in all_rules.items():
+        for rule in sym_rules:
+            c1, c2 = st.columns([4, 1])
+            c1.write(f"{rule_sym}: {describe_rule(rule)}")
+            if c2.button("Remove", key=f"rm_rule_{rule['id']}"):
+                try:
+                    engine.remove_rule(rule_sym, rule["id"])
+                except ValueError as e:
+                    st.error(f"{rule_sym}: could not remove alert — {e}")
+                else:
+                    st.rerun()
+
+show_charts = st.sidebar.checkbox("Show charts", value=False)
+
 # Show list
 st.subheader("Your Watchlist")
 if not st.session_state["watchlist"]:
@@ -36,7 +93,7 @@ else:
     for sym in st.session_state["watchlist"]:
         # Fetch data with guard
         try:
-            df = fetch_stock_data_with_fallback(sym)
+            df = fetch_cached(sym)
         except Exception as e:
             st.error(f"{sym}: data fetch failed — {e}")
             continue
@@ -45,19 +102,38 @@ else:
             st.warning(f"No data for {sym}")
             continue
 
-        # Score with guard
+        # Fold new bars into the carried indicator state and evaluate alerts
         try:
-            score, signals = score_stock(df)
+            fired, snap = engine.update(sym, df, rules=all_rules.get(sym, []))
         except Exception as e:
-            st.error(f"{sym}: scoring failed — {e}")
+            st.error(f"{sym}: alert evaluation failed — {e}")
             continue
 
+        score = snap["score"] if snap else 0
+        signals = snap["signals"] if snap else []
+
         st.markdown(f"**{sym} — Score: {score}**")
         if signals:
             st.write(", ".join(signals[:4]))
+        for event in fired:
+            st.success(f"🔔 {sym}: {event['message']}")
 
         # Chart with guard
-        try:
-            st.plotly_chart(create_tv_chart(df, sym), use_container_width=True)
-        except Exception as e:
-            st.error(f"{sym}: chart render failed — {e}")
+        if show_charts:
+            try:
+                st.plotly_chart(create_tv_chart(df, sym), use_container_width=True)
+            except Exception as e:
+                st.error(f"{sym}: chart render failed — {e}")
+
+# Alert log
+st.subheader("🔔 Alert Log")
+events = engine.read_events(limit=50)
+if events:
+    st.dataframe(
+        [{k: e[k] for k in ("time", "symbol", "bar", "message")} for e in events],
+        use_container_width=True,
+    )
+else:
+    st.caption("No alerts fired yet.")
+
+render_done()
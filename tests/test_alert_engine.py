@@ -0,0 +1,247 @@
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.alert_engine import AlertEngine, _advance, _new_state
+from utils.score_engine import score_stock
+from utils.technicals import calculate_macd, calculate_rsi
+
+
+def _bars(closes, volumes=None, start="2025-01-01"):
+    closes = np.asarray(closes, dtype=float)
+    if volumes is None:
+        volumes = np.full(len(closes), 1000.0)
+    index = pd.date_range(start, periods=len(closes), freq="B", tz="Asia/Kolkata")
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes + 0.5,
+            "Low": closes - 0.5,
+            "Close": closes,
+            "Volume": np.asarray(volumes, dtype=float),
+        },
+        index=index,
+    )
+
+
+def _random_walk(n=130, seed=1):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 2, n))
+    df = _bars(closes, rng.integers(1000, 5000, n))
+    df["High"] = closes + rng.random(n) * 2
+    return df
+
+
+def _decline_then_rally():
+    # 30 falling bars, then a steady 1% daily rally: RSI, MACD and the
+    # 20-day high each flip exactly once during the rally.
+    return _bars(list(np.linspace(120, 100, 30)) + [100 * 1.01 ** i for i in range(1, 41)])
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return AlertEngine(tmp_path)
+
+
+def _replay(engine, symbol, df, seed_bars):
+    """Seed with seed_bars, then feed one new bar per update."""
+    engine.update(symbol, df.iloc[:seed_bars])
+    events = []
+    for end in range(seed_bars + 1, len(df) + 1):
+        events += engine.update(symbol, df.iloc[:end])[0]
+    return events
+
+
+def test_carried_indicators_match_full_history():
+    df = _random_walk()
+    state = _new_state()
+    for i, (ts, row) in enumerate(df.iterrows()):
+        snap = _advance(state, ts, row.Close, row.High, row.Volume)
+        history = df.iloc[: i + 1]
+        macd, signal = calculate_macd(history["Close"].values)
+        assert snap["rsi"] == pytest.approx(calculate_rsi(history["Close"].values)[-1])
+        assert snap["macd"] == pytest.approx(macd[-1], abs=1e-9)
+        assert snap["signal"] == pytest.approx(signal[-1], abs=1e-9)
+        assert (snap["score"], snap["signals"]) == score_stock(history)
+
+
+def test_snapshot_score_matches_score_stock(engine):
+    df = _random_walk(seed=7)
+    engine.update("X.NS", df.iloc[:40])
+    for end in range(41, len(df) + 1):
+        _, snap = engine.update("X.NS", df.iloc[:end])
+        assert snap == engine.snapshot("X.NS")
+        assert (snap["score"], snap["signals"]) == score_stock(df.iloc[:end])
+
+
+def test_seeding_does_not_fire_on_past_bars(engine):
+    df = _decline_then_rally()
+    engine.add_rule("X.NS", "macd_cross", direction="bullish")
+    engine.add_rule("X.NS", "breakout_20d")
+    # The crossover and breakout both happen well before the newest bar
+    assert engine.update("X.NS", df)[0] == []
+    assert engine.read_events() == []
+
+
+@pytest.mark.parametrize(
+    "kind, params",
+    [
+        ("score_cross", {"threshold": 2, "direction": "below"}),
+        ("rsi_zone", {"low": 70, "high": 100}),
+        ("macd_cross", {"direction": "bullish"}),
+        ("breakout_20d", {}),
+    ],
+)
+def test_each_rule_kind_fires_once(engine, kind, params):
+    rule = engine.add_rule("X.NS", kind, **params)
+    events = _replay(engine, "X.NS", _decline_then_rally(), seed_bars=30)
+    assert [e["rule_id"] for e in events] == [rule["id"]]
+    assert events[0]["kind"] == kind
+
+
+def test_provisional_alert_not_refired_when_committed(engine):
+    df = _decline_then_rally()
+    engine.add_rule("X.NS", "macd_cross", direction="bullish")
+    engine.update("X.NS", df.iloc[:30])
+
+    fired_at = None
+    for end in range(31, len(df) + 1):
+        if engine.update("X.NS", df.iloc[:end])[0]:
+            fired_at = end
+            break
+    assert fired_at is not None
+
+    # The same bar, revised intraday, and then committed by the next bar
+    revised = df.iloc[:fired_at].copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 0.1
+    assert engine.update("X.NS", revised)[0] == []
+    assert engine.update("X.NS", df.iloc[: fired_at + 1])[0] == []
+    assert len(engine.read_events()) == 1
+
+
+def test_event_log_is_newest_first_and_filterable(engine):
+    df = _decline_then_rally()
+    engine.add_rule("A.NS", "macd_cross", direction="bullish")
+    engine.add_rule("B.NS", "breakout_20d")
+    _replay(engine, "A.NS", df, seed_bars=30)
+    _replay(engine, "B.NS", df, seed_bars=30)
+
+    events = engine.read_events()
+    assert [e["symbol"] for e in events] == ["B.NS", "A.NS"]
+    assert [e["symbol"] for e in engine.read_events(symbol="A.NS")] == ["A.NS"]
+    assert len(engine.read_events(limit=1)) == 1
+
+
+def test_nan_bar_is_skipped(engine, tmp_path):
+    df = _random_walk(n=120, seed=3)
+    df.iloc[60, df.columns.get_loc("Close")] = np.nan
+    engine.update("X.NS", df.iloc[:40])
+    for end in range(41, len(df) + 1):
+        engine.update("X.NS", df.iloc[:end])
+
+    snap = engine.snapshot("X.NS")
+    assert np.isfinite(snap["macd"]) and np.isfinite(snap["signal"])
+    assert (snap["score"], snap["signals"]) == score_stock(df.dropna())
+
+    # State files must stay standard JSON (no NaN literals)
+    def reject(constant):
+        raise ValueError(constant)
+
+    for path in (tmp_path / "state").glob("*.json"):
+        json.loads(path.read_text(encoding="utf-8"), parse_constant=reject)
+
+
+def test_concurrent_add_rule_keeps_every_rule(engine):
+    def add(i):
+        for _ in range(20):
+            engine.add_rule(f"S{i}.NS", "breakout_20d")
+
+    threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    all_rules = engine.rules()
+    assert sum(len(r) for r in all_rules.values()) == 160
+    assert not list(engine.store_dir.glob("*.tmp"))
+
+
+def test_corrupt_rules_file_is_not_overwritten(engine):
+    engine.rules_path.write_text('{"X.NS": [', encoding="utf-8")
+    assert engine.rules() == {}
+    with pytest.raises(ValueError):
+        engine.add_rule("Y.NS", "breakout_20d")
+    assert engine.rules_path.read_text(encoding="utf-8") == '{"X.NS": ['
+
+
+def test_unchanged_data_skips_work(engine, monkeypatch):
+    df = _random_walk(n=60)
+    engine.add_rule("X.NS", "breakout_20d")
+    engine.update("X.NS", df)
+
+    writes = []
+    monkeypatch.setattr(engine, "_write_json", lambda path, data: writes.append(path))
+    events, snap = engine.update("X.NS", df)
+    assert events == [] and snap == engine.snapshot("X.NS")
+    assert writes == []
+
+    # A revised provisional bar is evaluated again
+    revised = df.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 1.0
+    engine.update("X.NS", revised)
+    assert len(writes) == 1
+
+
+def test_score_cross_ignores_warm_up(engine):
+    df = _bars([100 * 1.01 ** i for i in range(30)])
+    assert score_stock(df.iloc[:20])[0] >= 1
+    engine.add_rule("X.NS", "score_cross", threshold=1, direction="above")
+    # Score goes 0 (warm-up) -> positive at bar 20 and stays there
+    assert _replay(engine, "X.NS", df, seed_bars=10) == []
+
+
+def test_removed_rules_are_dropped_from_state(engine, tmp_path):
+    df = _decline_then_rally()
+    rule = engine.add_rule("X.NS", "macd_cross", direction="bullish")
+    assert _replay(engine, "X.NS", df.iloc[:50], seed_bars=30)
+
+    engine.remove_rule("X.NS", rule["id"])
+    engine.update("X.NS", df.iloc[:51])
+    state = json.loads((tmp_path / "state" / "X.NS.json").read_text(encoding="utf-8"))
+    assert state["fired"] == {}
+
+
+def test_read_events_reads_tail_across_blocks(engine):
+    lines = [
+        json.dumps({"symbol": "A.NS" if i % 3 else "B.NS", "message": f"event {i}"})
+        for i in range(2000)
+    ]
+    engine.events_path.write_text("\n".join(lines) + "\n{\"trunc", encoding="utf-8")
+
+    assert [e["message"] for e in engine.read_events(limit=3)] == [
+        "event 1999", "event 1998", "event 1997",
+    ]
+    b_events = engine.read_events(limit=2, symbol="B.NS")
+    assert [e["message"] for e in b_events] == ["event 1998", "event 1995"]
+    assert len(engine.read_events(limit=5000)) == 2000
+
+
+def test_update_uses_passed_rules_without_reading_rules_file(engine, monkeypatch):
+    df = _decline_then_rally()
+    rule = engine.add_rule("X.NS", "macd_cross", direction="bullish")
+    rules = engine.rules("X.NS")
+    engine.update("X.NS", df.iloc[:30], rules=rules)
+
+    def fail():
+        raise AssertionError("rules.json re-read")
+
+    monkeypatch.setattr(engine, "_load_rules", fail)
+    events = []
+    for end in range(31, len(df) + 1):
+        events += engine.update("X.NS", df.iloc[:end], rules=rules)[0]
+    assert [e["rule_id"] for e in events] == [rule["id"]]
+    assert engine.update("X.NS", df.iloc[:0], rules=rules) == ([], engine.snapshot("X.NS"))
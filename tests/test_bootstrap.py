@@ -0,0 +1,23 @@
+import sys
+import threading
+import time
+
+from utils.bootstrap import TIMINGS, lazy_import
+
+
+def test_lazy_import_waits_for_module_being_imported(tmp_path, monkeypatch):
+    (tmp_path / "slow_dummy_mod.py").write_text(
+        "import time\ntime.sleep(0.3)\nTicker = object()\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "slow_dummy_mod", raising=False)
+
+    first = threading.Thread(target=lazy_import, args=("slow_dummy_mod",))
+    first.start()
+    time.sleep(0.1)  # first thread is now mid-import
+    complete = hasattr(lazy_import("slow_dummy_mod"), "Ticker")
+    first.join()
+
+    assert complete
+    assert TIMINGS.pop("import: slow_dummy_mod")["count"] == 1
+    sys.modules.pop("slow_dummy_mod", None)
@@ -0,0 +1,434 @@
+# utils/alert_engine.py
+
+# Incremental alert engine for watchlist symbols.
+# - Users register conditions per symbol (score threshold cross, RSI zone,
+#   MACD crossover, 20-day breakout).
+# - Indicator state (RSI windows, EMA accumulators, recent closes/highs/volumes)
+#   is carried on disk per symbol, so each check only processes bars that
+#   arrived since the previous check instead of recomputing full history.
+# - The newest bar is treated as provisional (intraday bars keep changing):
+#   it is evaluated on a copy of the state and committed once a later bar
+#   lands. Alerts are de-duplicated per rule and bar. If the provisional bar
+#   and the rules are unchanged, an update does no work and writes nothing.
+# - Fired alerts are appended to an on-disk JSON Lines event log.
+
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.score_engine import score_latest_bar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path(__file__).resolve().parent.parent / "alerts"
+
+# Streamlit runs sessions as threads of one process that share the store;
+# every read-modify-write of rules, state or the event log holds this lock.
+_LOCK = threading.Lock()
+
+RULE_KINDS = {
+    "score_cross": "Score crosses threshold",
+    "rsi_zone": "RSI enters zone",
+    "macd_cross": "MACD crossover",
+    "breakout_20d": "20-day high breakout",
+}
+
+RSI_PERIOD = 14
+SCORE_MIN_BARS = 20  # score_stock returns 0 below this many bars
+BREAKOUT_WINDOW = 20
+
+
+def _new_state():
+    return {
+        "bars": 0,
+        "last_ts": None,
+        "prev_close": None,
+        "gains": [],
+        "losses": [],
+        "ema12": [0.0, 0.0],
+        "ema26": [0.0, 0.0],
+        "ema_signal": [0.0, 0.0],
+        "closes": [],
+        "volumes": [],
+        "highs": [],
+        "last": None,
+        "snapshot": None,
+        "provisional": None,
+        "fired": {},
+    }
+
+
+def _push(values, value, maxlen):
+    values.append(value)
+    if len(values) > maxlen:
+        del values[0]
+
+
+def _ema_step(acc, value, span):
+    """
+    One step of pandas' ewm(span=span, adjust=True).mean().
+
+    acc holds the weighted numerator and denominator and is updated in place.
+    """
+    decay = 1.0 - 2.0 / (span + 1.0)
+    acc[0] = acc[0] * decay + value
+    acc[1] = acc[1] * decay + 1.0
+    return acc[0] / acc[1]
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def _advance(state, ts, close, high, volume):
+    """
+    Fold one bar into the carried state and return its indicator snapshot.
+
+    Mirrors calculate_rsi, calculate_macd, calculate_smoothed_ma and
+    score_stock from utils.technicals / utils.score_engine.
+    """
+    close, high, volume = float(close), float(high), float(volume)
+    prev_close = state["prev_close"]
+    prev = state["last"]
+
+    # RSI (simple rolling mean of gains/losses, as in calculate_rsi)
+    delta = 0.0 if prev_close is None else close - prev_close
+    _push(state["gains"], max(delta, 0.0), RSI_PERIOD)
+    _push(state["losses"], max(-delta, 0.0), RSI_PERIOD)
+    avg_loss = _mean(state["losses"]) or 1e-10
+    rsi = 100 - (100 / (1 + _mean(state["gains"]) / avg_loss))
+
+    # MACD
+    macd = _ema_step(state["ema12"], close, 12) - _ema_step(state["ema26"], close, 26)
+    signal = _ema_step(state["ema_signal"], macd, 9)
+
+    # Breakout over the prior 20 highs (excluding the current bar)
+    prior_highs = state["highs"][-BREAKOUT_WINDOW:]
+    breakout = len(prior_highs) == BREAKOUT_WINDOW and close > max(prior_highs)
+
+    _push(state["closes"], close, 50)
+    _push(state["volumes"], volume, 20)
+    _push(state["highs"], high, BREAKOUT_WINDOW + 1)
+    state["bars"] += 1
+    state["prev_close"] = close
+    state["last_ts"] = ts.isoformat()
+
+    score, signals = 0, []
+    if state["bars"] >= SCORE_MIN_BARS:
+        try:
+            mean_20 = _mean(state["volumes"])
+            vol_ratio = _mean(state["volumes"][-3:]) / mean_20 if mean_20 else 0.0
+            score, signals = score_latest_bar(
+                close, prev_close, rsi, macd, prev["macd"], signal, prev["signal"],
+                _mean(state["closes"][-20:]), _mean(state["closes"]), vol_ratio,
+                max(state["highs"][-BREAKOUT_WINDOW:]),
+            )
+        except Exception:
+            score, signals = 0, []
+
+    snapshot = {
+        "ts": state["last_ts"],
+        "bars": state["bars"],
+        "close": close,
+        "rsi": rsi,
+        "macd": macd,
+        "signal": signal,
+        "breakout": breakout,
+        "score": score,
+        "signals": signals,
+    }
+    state["last"] = snapshot
+    return snapshot
+
+
+def _check_rule(rule, prev, cur):
+    """Return an alert message if the rule's condition became true on cur, else None."""
+    if prev is None:
+        return None
+    kind = rule["kind"]
+    params = rule.get("params", {})
+
+    if kind == "score_cross":
+        # The score is forced to 0 during warm-up; leaving it is not a cross
+        if prev.get("bars", 0) < SCORE_MIN_BARS:
+            return None
+        threshold = float(params.get("threshold", 10))
+        if params.get("direction", "above") == "above":
+            if prev["score"] < threshold <= cur["score"]:
+                return f"Score rose to {cur['score']} (≥ {threshold:g})"
+        elif prev["score"] >= threshold > cur["score"]:
+            return f"Score fell to {cur['score']} (< {threshold:g})"
+
+    elif kind == "rsi_zone":
+        low, high = float(params.get("low", 0)), float(params.get("high", 30))
+        if low <= cur["rsi"] <= high and not low <= prev["rsi"] <= high:
+            return f"RSI {cur['rsi']:.1f} entered {low:g}–{high:g}"
+
+    elif kind == "macd_cross":
+        if params.get("direction", "bullish") == "bullish":
+            if cur["macd"] > cur["signal"] and prev["macd"] <= prev["signal"]:
+                return "MACD crossed above signal"
+        elif cur["macd"] < cur["signal"] and prev["macd"] >= prev["signal"]:
+            return "MACD crossed below signal"
+
+    elif kind == "breakout_20d":
+        if cur["breakout"] and not prev["breakout"]:
+            return f"Close {cur['close']:,.2f} broke the 20-day high"
+
+    return None
+
+
+def describe_rule(rule):
+    """Human-readable one-liner for a rule dict."""
+    kind = rule["kind"]
+    params = rule.get("params", {})
+    if kind == "score_cross":
+        return f"Score {params.get('direction', 'above')} {params.get('threshold', 10)}"
+    if kind == "rsi_zone":
+        return f"RSI in {params.get('low', 0)}–{params.get('high', 30)}"
+    if kind == "macd_cross":
+        return f"MACD {params.get('direction', 'bullish')} crossover"
+    return RULE_KINDS.get(kind, kind)
+
+
+def _lines_backwards(path, block_size=8192):
+    """Yield the lines of a file from last to first, reading blocks from the end."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+            partial = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.decode("utf-8", errors="replace")
+        if partial.strip():
+            yield partial.decode("utf-8", errors="replace")
+
+
+class AlertEngine:
+    """
+    Evaluate per-symbol alert rules on new bars only.
+
+    Layout of store_dir:
+      rules.json         {symbol: [rule, ...]}
+      state/<SYM>.json   carried indicator state per symbol
+      events.jsonl       fired alerts, one JSON object per line
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.state_dir = self.store_dir / "state"
+        self.rules_path = self.store_dir / "rules.json"
+        self.events_path = self.store_dir / "events.jsonl"
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    # ---------- storage helpers ----------
+
+    def _write_json(self, path, data):
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=path.name + ".",
+            suffix=".tmp", delete=False,
+        ) as f:
+            json.dump(data, f, allow_nan=False)
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+
+    def _read_json(self, path, default):
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def _state_path(self, symbol):
+        safe = "".join(c if c.isalnum() or c in "._-" else "_" for c in symbol)
+        return self.state_dir / f"{safe}.json"
+
+    # ---------- rules ----------
+
+    def _load_rules(self):
+        """
+        Read rules.json; call with _LOCK held.
+
+        Raises ValueError if the file exists but cannot be parsed, so callers
+        never mistake a corrupt file for "no rules" and overwrite it.
+        """
+        try:
+            with self.rules_path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logger.error("Alert rules file %s is unreadable: %s", self.rules_path, e)
+            raise ValueError(f"Alert rules file {self.rules_path} is corrupt; not modifying it") from e
+
+    def rules(self, symbol=None):
+        """All rules as {symbol: [rule, ...]}, or the list for one symbol."""
+        with _LOCK:
+            try:
+                all_rules = self._load_rules()
+            except ValueError:
+                all_rules = {}
+        return all_rules if symbol is None else all_rules.get(symbol, [])
+
+    def add_rule(self, symbol, kind, **params):
+        if kind not in RULE_KINDS:
+            raise ValueError(f"Unknown alert kind: {kind}")
+        rule = {"id": uuid.uuid4().hex[:8], "kind": kind, "params": params}
+        with _LOCK:
+            all_rules = self._load_rules()
+            all_rules.setdefault(symbol, []).append(rule)
+            self._write_json(self.rules_path, all_rules)
+        return rule
+
+    def remove_rule(self, symbol, rule_id):
+        with _LOCK:
+            all_rules = self._load_rules()
+            remaining = [r for r in all_rules.get(symbol, []) if r["id"] != rule_id]
+            if remaining:
+                all_rules[symbol] = remaining
+            else:
+                all_rules.pop(symbol, None)
+            self._write_json(self.rules_path, all_rules)
+
+    # ---------- evaluation ----------
+
+    def snapshot(self, symbol):
+        """Latest indicator snapshot (score, signals, RSI, MACD...) or None."""
+        with _LOCK:
+            state = self._read_json(self._state_path(symbol), None)
+        return state["snapshot"] if state else None
+
+    def update(self, symbol, df, rules=None):
+        """
+        Fold bars newer than the carried state into it and evaluate rules.
+
+        The first call for a symbol seeds the state from the full history
+        without firing on past bars; later calls only touch new bars.
+        Pass rules (this symbol's list, e.g. from one rules() call per page
+        run) to avoid re-reading rules.json for every symbol.
+
+        Returns:
+            events (list): alerts fired by this call (also appended to the log)
+            snapshot (dict): latest indicator snapshot, or None without data
+        """
+        with _LOCK:
+            return self._update(symbol, df, rules)
+
+    def _update(self, symbol, df, rules):
+        path = self._state_path(symbol)
+        state = self._read_json(path, None)
+        seeding = state is None
+        if seeding:
+            state = _new_state()
+        if df is None or df.empty:
+            return [], state["snapshot"]
+
+        bars = df[["Close", "High", "Volume"]]
+        if state["last_ts"] is not None:
+            bars = bars[bars.index > pd.Timestamp(state["last_ts"])]
+        # yfinance occasionally returns NaN rows; folding one into the EMA
+        # accumulators would poison MACD for this symbol permanently.
+        bars = bars[np.isfinite(bars.to_numpy(dtype=float)).all(axis=1)]
+        if bars.empty:
+            return [], state["snapshot"]
+
+        if rules is None:
+            try:
+                rules = self._load_rules().get(symbol, [])
+            except ValueError:
+                rules = []
+        events = []
+
+        def evaluate(prev, cur):
+            for rule in rules:
+                if state["fired"].get(rule["id"]) == cur["ts"]:
+                    continue
+                message = _check_rule(rule, prev, cur)
+                if message:
+                    state["fired"][rule["id"]] = cur["ts"]
+                    events.append({
+                        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                        "symbol": symbol,
+                        "rule_id": rule["id"],
+                        "kind": rule["kind"],
+                        "bar": cur["ts"],
+                        "message": message,
+                    })
+
+        *completed, newest = bars.itertuples()
+
+        # Nothing moved since the last check: same provisional bar, same rules
+        rule_ids = sorted(rule["id"] for rule in rules)
+        provisional_key = [newest[0].isoformat(), *(float(v) for v in newest[1:]), rule_ids]
+        if not completed and state.get("provisional") == provisional_key:
+            return [], state["snapshot"]
+
+        # Forget de-duplication marks of rules that have been removed
+        state["fired"] = {
+            rule_id: ts for rule_id, ts in state["fired"].items()
+            if rule_id in rule_ids
+        }
+
+        # Completed bars: commit into the carried state
+        for ts, close, high, volume in completed:
+            prev = state["last"]
+            cur = _advance(state, ts, close, high, volume)
+            if not seeding:
+                evaluate(prev, cur)
+
+        # Newest bar: provisional, evaluated on a copy of the state
+        ts, close, high, volume = newest
+        provisional = copy.deepcopy(state)
+        prev = state["last"]
+        state["snapshot"] = _advance(provisional, ts, close, high, volume)
+        evaluate(prev, state["snapshot"])
+        state["provisional"] = provisional_key
+
+        self._write_json(path, state)
+        if events:
+            with self.events_path.open("a", encoding="utf-8") as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        return events, state["snapshot"]
+
+    def read_events(self, limit=50, symbol=None):
+        """Most recent fired alerts, newest first; reads the log from the end."""
+        recent = []
+        with _LOCK:
+            if not self.events_path.exists():
+                return []
+            for line in _lines_backwards(self.events_path):
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if symbol is None or event.get("symbol") == symbol:
+                    recent.append(event)
+                    if len(recent) >= limit:
+                        break
+        return recent
+
+    def reset(self, symbol):
+        """Drop carried state so the next update re-seeds from full history."""
+        with _LOCK:
+            try:
+                self._state_path(symbol).unlink()
+            except FileNotFoundError:
+                pass
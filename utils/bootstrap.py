@@ -0,0 +1,116 @@
+# utils/bootstrap.py
+
+# Startup helpers shared by app.py and the pages.
+# - Heavy libraries (plotly, yfinance) are imported on first use through
+#   lazy_import instead of at module top level, so a page only pays for
+#   them when it actually draws a chart or downloads data.
+# - Static assets are memoized per process (functools.lru_cache), so Streamlit
+#   reruns do not hit the disk again. st.cache_resource costs more per call
+#   (argument hashing, locking) than re-reading a small CSS file.
+# - Import and render timings are collected in TIMINGS and can be shown
+#   with render_timings().
+
+import functools
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import streamlit as st
+    cache_resource = st.cache_resource
+except Exception:
+    # Outside Streamlit a plain per-process memo gives the same semantics.
+    def cache_resource(*dargs, **dkwargs):
+        return functools.lru_cache(maxsize=None)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# {label: {"first": ms, "last": ms, "count": n}}
+TIMINGS = {}
+
+
+def record_timing(label, ms):
+    entry = TIMINGS.get(label)
+    if entry is None:
+        TIMINGS[label] = {"first": ms, "last": ms, "count": 1}
+    else:
+        entry["last"] = ms
+        entry["count"] += 1
+
+
+@contextmanager
+def timed(label):
+    """Record how long the enclosed block takes under label (in ms)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(label, (time.perf_counter() - start) * 1000)
+
+
+def page_timer(name):
+    """
+    Start timing a page render; call the returned function at the end of the page.
+
+    The first call per process is the cold render, later ones are reruns.
+    """
+    start = time.perf_counter()
+
+    def stop():
+        record_timing(f"render: {name}", (time.perf_counter() - start) * 1000)
+
+    return stop
+
+
+def lazy_import(name):
+    """Import a module on first use and record the one-off import cost."""
+    # Always go through import_module: a module sits in sys.modules before it
+    # has finished executing, and only the import lock makes another session
+    # thread wait for it to complete.
+    if name in sys.modules:
+        return importlib.import_module(name)
+    with timed(f"import: {name}"):
+        return importlib.import_module(name)
+
+
+def plotly_modules():
+    """
+    Returns:
+        go (module): plotly.graph_objects
+        make_subplots (function): plotly.subplots.make_subplots
+    """
+    go = lazy_import("plotly.graph_objects")
+    make_subplots = lazy_import("plotly.subplots").make_subplots
+    return go, make_subplots
+
+
+@functools.lru_cache(maxsize=None)
+def load_static_text(relative_path):
+    """Read a text asset under the project root once per process; None if missing."""
+    path = PROJECT_ROOT / relative_path
+    if not path.exists():
+        return None
+    with path.open("r", encoding="utf-8") as f:
+        return f.read()
+
+
+def render_timings():
+    """Show collected import/render timings in a sidebar expander."""
+    with st.sidebar.expander("⏱ Startup timings", expanded=False):
+        if not TIMINGS:
+            st.caption("No timings recorded yet.")
+            return
+        st.dataframe(
+            [
+                {
+                    "step": label,
+                    "first (ms)": round(t["first"], 1),
+                    "last (ms)": round(t["last"], 1),
+                    "runs": t["count"],
+                }
+                for label, t in TIMINGS.items()
+            ],
+            use_container_width=True,
+        )
@@ -1,7 +1,7 @@
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from utils.bootstrap import plotly_modules
 
 def create_tv_chart(df, symbol):
+    go, make_subplots = plotly_modules()
     colors = {
         'bg': '#131722', 'up': '#26a69a', 'down': '#ef5350', 'sma20': '#2196f3', 'sma50': '#ff9800',
         'macd': '#4caf50', 'signal': '#f44336', 'rsi': '#00bcd4', 'grid': '#363a45', 'text': '#d1d4dc'
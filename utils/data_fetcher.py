@@ -1,9 +1,11 @@
-import yfinance as yf
+from utils.bootstrap import lazy_import
 
 def fetch_stock_data_with_fallback(symbol, period="6mo"):
     """
     Fetch stock data with automatic NSE/BSE suffix handling
     """
+    yf = lazy_import("yfinance")
+
     # Auto-append .NS for NSE if not already present
     if not symbol.endswith('.NS') and not symbol.endswith('.BO'):
         symbol = f"{symbol}.NS"
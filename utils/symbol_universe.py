@@ -1,24 +1,15 @@
 # utils/symbol_universe.py
 
-# Lint-safe import and cache decorator:
-# - If Streamlit is available (normal app run), use st.cache_data.
-# - If not (e.g., CI linting), provide a no-op decorator so flake8
-#   does not complain and the module imports cleanly.
-
-try:
-    import streamlit as st
-    cache_data = st.cache_data
-except Exception:
-    # Fallback no-op decorator for lint/test environments without Streamlit.
-    def cache_data(*dargs, **dkwargs):
-        def _wrap(func):
-            return func
-        return _wrap
+# The universe is cached as a process-level resource (st.cache_resource):
+# unlike st.cache_data it is not copied on every rerun, and the pages only
+# read from it. Outside Streamlit the decorator falls back to a memo.
 
 import pandas as pd
 
+from utils.bootstrap import cache_resource
 
-@cache_data(ttl=3600, show_spinner=False)
+
+@cache_resource(ttl=3600, show_spinner=False)
 def load_all_symbols():
     """
     Load symbol universe from assets/data/indian_stocks_full.csv.